@@ -26,14 +26,23 @@ class CoordinatesDemandManager:
     def create_graph_from_manager(self):
         g = nx.DiGraph()
 
-        for _, row in self.cities.iterrows():
-            g.add_node(int(row['ID']), pos=(row['X'], row['Y']), demand=row['Demand'])
-
         distances = self.get_distances()
-        for i in distances.index:
-            for j in distances.columns:
-                if i != j:  # auto-bucles
-                    g.add_edge(str(i), str(j), cost=distances.loc[i, j])
+        # Los nodos usan las mismas etiquetas que las aristas, así pos/demand quedan en esos nodos
+        labels = [str(i) for i in distances.index]
+        coords = self.cities[['X', 'Y']].to_numpy()
+        demands = self.cities['Demand'].to_numpy()
+        g.add_nodes_from(
+            (label, {'pos': (x, y), 'demand': demand})
+            for label, (x, y), demand in zip(labels, coords, demands)
+        )
+
+        # Todos los pares salvo la diagonal (auto-bucles), leídos de la matriz en un solo gather
+        sources, targets = np.nonzero(~np.eye(len(labels), dtype=bool))
+        costs = distances.to_numpy()[sources, targets]
+        g.add_edges_from(
+            (labels[i], labels[j], {'cost': cost})
+            for i, j, cost in zip(sources, targets, costs)
+        )
 
         return g
 
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import random
 import networkx as nx
 
@@ -28,22 +28,28 @@ class ACO:
     max_pheromone_level: float = 1.0
     # limit τ_min
     min_pheromone_level: float = 0.02
-
+    # Seed of the random number generator shared by the search, None seeds from the OS
+    seed: Optional[int] = None
 
     def __post_init__(self):
+        self.rng = random.Random(self.seed)
         self.graph_api = GraphApi(self.graph, self.evaporation_rate)
         # Initialize all edges of the graph with a maximum pheromone value
-        for edge in self.graph.edges:
-            self.graph_api.set_edge_pheromones(edge[0], edge[1], self.max_pheromone_level)
+        self.graph_api.set_all_edges_pheromones(self.max_pheromone_level)
 
     def _deploy_forward_search_ants(self) -> None:
         """Deploy forward search ants in the graph"""
+        ant_max_steps = self.ant_max_steps
         for ant in self.search_ants:
-            for _ in range(self.ant_max_steps):
-                if ant.reached_destination():
+            # Bind the per-step methods once instead of resolving them on every step
+            reached_destination, take_step = ant.reached_destination, ant.take_step
+            for _ in range(ant_max_steps):
+                if reached_destination():
                     ant.is_fit = True
                     break
-                ant.take_step()
+                # A stuck ant only has visited neighbors, so the remaining steps cannot move it
+                if not take_step():
+                    break
 
     def _deploy_backward_search_ants(self) -> None:
         """Deploy fit search ants back towards their source node while dropping pheromones on the path"""
@@ -67,19 +73,21 @@ class ACO:
         for _ in range(self.num_iterations):
             self.search_ants.clear()
 
-            for _ in range(num_ants):
-                spawn_point = (
-                    random.choice(self.graph_api.get_all_nodes())
-                    if self.ant_random_spawn
-                    else source
-                )
+            # Draw the spawn points of the whole wave at once
+            spawn_points = (
+                self.rng.choices(self.graph_api.get_all_nodes(), k=num_ants)
+                if self.ant_random_spawn
+                else [source] * num_ants
+            )
 
+            for spawn_point in spawn_points:
                 ant = Ant(
                     self.graph_api,
                     spawn_point,
                     destination,
                     alpha=self.alpha,
                     beta=self.beta,
+                    rng=self.rng,
                 )
                 self.search_ants.append(ant)
 
@@ -1,11 +1,14 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Union
+from typing import List, Union
+import random
+
+import numpy as np
 
 from MMAS import utils
 from MMAS.graph_api import GraphApi
 
 
-@dataclass
+@dataclass(slots=True)
 class Ant:
     graph_api: GraphApi
     source: str
@@ -14,8 +17,10 @@ class Ant:
     alpha: float = 0.7
     # Edge cost bias
     beta: float = 0.3
-    # Set of nodes that have been visited by the ant
-    visited_nodes: Set = field(default_factory=set)
+    # Random number generator used to pick the next node
+    rng: random.Random = field(default_factory=random.Random)
+    # Mask over the graph nodes (by index) that have been visited by the ant
+    visited_nodes: np.ndarray = field(init=False)
     # Path taken by the ant so far
     path: List[str] = field(default_factory=list)
     # Cost of the path taken by the ant so far
@@ -24,10 +29,17 @@ class Ant:
     is_fit: bool = False
     # Indicates if the ant is the pheromone-greedy solution ant
     is_solution_ant: bool = False
+    # Index of the node the ant is currently at
+    current_node: int = field(init=False)
+    # Index of the destination node
+    destination_node: int = field(init=False)
 
     def __post_init__(self) -> None:
+        # The ant moves over node indices of the graph API, only the path keeps the node names
+        self.visited_nodes = np.zeros(len(self.graph_api.nodes), dtype=bool)
+        self.destination_node = self.graph_api.node_index[self.destination]
         # Set the spawn node as the current and first node
-        self.current_node = self.source
+        self.current_node = self.graph_api.node_index[self.source]
         self.path.append(self.source)
 
     def reached_destination(self) -> bool:
@@ -36,79 +48,62 @@ class Ant:
         Returns:
             bool: returns True if the ant has reached the destination
         """
-        return self.current_node == self.destination
+        return self.current_node == self.destination_node
 
-    def _get_unvisited_neighbors(self) -> List[str]:
+    def _get_unvisited_neighbors(self) -> np.ndarray:
         """Returns a subset of the neighbors of the node which are unvisited
 
         Returns:
-            List[str]: A list of all the unvisited neighbors
+            np.ndarray: The indices of all the unvisited neighbors
         """
-        return [
-            node
-            for node in self.graph_api.get_neighbors(self.current_node)
-            if node not in self.visited_nodes
-        ]
+        neighbors = self.graph_api.get_neighbor_indices(self.current_node)
+        return neighbors[~self.visited_nodes[neighbors]]
 
-    def _compute_all_edges_desirability(
+    def _compute_edges_desirability(
             self,
-            unvisited_neighbors: List[str],
-    ) -> float:
-        """Computes the denominator of the transition probability equation for the ant
+            unvisited_neighbors: np.ndarray,
+    ) -> np.ndarray:
+        """Computes the desirability of every outgoing edge (to unvisited nodes) from the current node
 
         Args:
-            unvisited_neighbors (List[str]): All unvisited neighbors of the current node
+            unvisited_neighbors (np.ndarray): The indices of all unvisited neighbors of the current node
 
         Returns:
-            float: The summation of all the outgoing edges (to unvisited nodes) from the current node
+            np.ndarray: The desirability of each edge, in the same order as the neighbors
         """
-        total = 0.0
-        for neighbor in unvisited_neighbors:
-            edge_pheromones = self.graph_api.get_edge_pheromones(
-                self.current_node, neighbor
-            )
-            edge_cost = self.graph_api.get_edge_cost(self.current_node, neighbor)
-            total += utils.compute_edge_desirability(
-                edge_pheromones, edge_cost, self.alpha, self.beta
-            )
-
-        return total
+        edges_pheromones = self.graph_api.get_edges_pheromones(
+            self.current_node, unvisited_neighbors
+        )
+        edges_heuristic = self.graph_api.get_edges_heuristic(
+            self.current_node, unvisited_neighbors, self.beta
+        )
+        return utils.compute_edge_desirability(
+            edges_pheromones, edges_heuristic, self.alpha
+        )
 
     def _calculate_edge_probabilities(
-            self, unvisited_neighbors: List[str]
-    ) -> Dict[str, float]:
+            self, unvisited_neighbors: np.ndarray
+    ) -> np.ndarray:
         """Computes the transition probabilities of all the edges from the current node
 
         Args:
-            unvisited_neighbors (List[str]): A list of unvisited neighbors of the current node
+            unvisited_neighbors (np.ndarray): The indices of the unvisited neighbors of the current node
 
         Returns:
-            Dict[str, float]: A dictionary mapping nodes to their transition probabilities
+            np.ndarray: The transition probability of each edge, in the same order as the neighbors
         """
-        probabilities: Dict[str, float] = {}
-
-        all_edges_desirability = self._compute_all_edges_desirability(
-            unvisited_neighbors
-        )
+        edges_desirability = self._compute_edges_desirability(unvisited_neighbors)
 
-        for neighbor in unvisited_neighbors:
-            edge_pheromones = self.graph_api.get_edge_pheromones(
-                self.current_node, neighbor
-            )
-            edge_cost = self.graph_api.get_edge_cost(self.current_node, neighbor)
-
-            current_edge_desirability = utils.compute_edge_desirability(
-                edge_pheromones, edge_cost, self.alpha, self.beta
-            )
-            probabilities[neighbor] = current_edge_desirability / all_edges_desirability
+        # The denominator of the transition probability equation is the sum of the same terms
+        all_edges_desirability = edges_desirability.sum()
 
-        return probabilities
+        return edges_desirability / all_edges_desirability
 
-    def _choose_next_node(self) -> Union[str, None]:
+    def _choose_next_node(self) -> Union[int, None]:
         """Choose the next node to be visited by the ant
 
         Returns:
-            [str, None]: The computed next node to be visited by the ant or None if no possible moves
+            [int, None]: The index of the next node to be visited by the ant or None if no possible moves
         """
         unvisited_neighbors = self._get_unvisited_neighbors()
 
@@ -119,12 +114,10 @@ class Ant:
                 )
 
             # The final/solution ant greedily chooses the next node with the highest pheromone value
-            return max(
-                unvisited_neighbors,
-                key=lambda neighbor: self.graph_api.get_edge_pheromones(
-                    self.current_node, neighbor
-                ),
+            edges_pheromones = self.graph_api.get_edges_pheromones(
+                self.current_node, unvisited_neighbors
             )
+            return int(unvisited_neighbors[edges_pheromones.argmax()])
 
         # Check if ant has no possible nodes to move to
         if len(unvisited_neighbors) == 0:
@@ -133,28 +126,34 @@ class Ant:
         probabilities = self._calculate_edge_probabilities(unvisited_neighbors)
 
         # Pick the next node based on the roulette wheel selection technique
-        return utils.roulette_wheel_selection(probabilities)
+        return utils.roulette_wheel_selection(unvisited_neighbors, probabilities, self.rng)
 
-    def take_step(self) -> None:
-        """Compute and update the ant position"""
+    def take_step(self) -> bool:
+        """Compute and update the ant position
+
+        Returns:
+            bool: returns False if the ant is stuck at the current node and could not move
+        """
         # Mark the current node as visited
-        self.visited_nodes.add(self.current_node)
+        self.visited_nodes[self.current_node] = True
 
         # Pick the next node of the ant
         next_node = self._choose_next_node()
 
-        # Check if ant is stuck at current node
-        if not next_node:
-            # TODO: optimization: set ant as unfit
-            return
+        # Check if ant is stuck at current node, it stays unfit since it can never move again
+        if next_node is None:
+            return False
 
-        self.path.append(next_node)
-        self.path_cost += self.graph_api.get_edge_cost(self.current_node, next_node)
+        self.path_cost += self.graph_api.get_edge_cost_by_index(self.current_node, next_node)
+        self.path.append(self.graph_api.nodes[next_node])
         self.current_node = next_node
+        return True
 
     def deposit_pheromones_on_path(self) -> None:
         """Updates the pheromones along all the edges in the path"""
-        for i in range(len(self.path) - 1):
-            u, v = self.path[i], self.path[i + 1]
-            new_pheromone_value = 1 / self.path_cost
-            self.graph_api.deposit_pheromones(u, v, new_pheromone_value)
+        # An ant spawned at its destination has no edges to reinforce
+        if len(self.path) < 2:
+            return
+
+        new_pheromone_value = 1 / self.path_cost
+        self.graph_api.deposit_pheromones_on_path(self.path, new_pheromone_value)
@@ -1,7 +1,10 @@
+import numbers
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Tuple
 import networkx as nx
-import matplotlib.pyplot as plt
+import numpy as np
+
+from MMAS import utils
 
 
 @dataclass
@@ -9,31 +12,94 @@ class GraphApi:
     graph: nx.DiGraph
     evaporation_rate: float
 
+    def __post_init__(self) -> None:
+        # Dense edge tables indexed by node position, so lookups skip the nested graph dicts
+        self.nodes: Tuple[str, ...] = tuple(self.graph.nodes)
+        self.node_index: Dict[str, int] = {node: i for i, node in enumerate(self.nodes)}
+        num_nodes = len(self.nodes)
+        self.cost_matrix = np.full((num_nodes, num_nodes), np.inf)
+        self.pheromone_matrix = np.zeros((num_nodes, num_nodes))
+        # Matrix positions of every edge, edge existence does not depend on its cost value
+        edge_sources, edge_targets = [], []
+        for u, v, cost in self.graph.edges(data="cost"):
+            # A missing cost would be stored as NaN by the matrix, check it before the write
+            if cost is None:
+                raise ValueError(f"Edge from {u} to {v} has no cost attribute")
+            if not isinstance(cost, numbers.Real):
+                raise TypeError(f"Edge from {u} to {v} has a non numeric cost: {cost!r}")
+            # The cost heuristic is 1 / cost, a zero cost edge would turn the probabilities into NaN
+            if cost == 0:
+                raise ValueError(
+                    f"Edge from {u} to {v} has cost 0, the cost heuristic 1 / cost is undefined"
+                )
+            edge_sources.append(self.node_index[u])
+            edge_targets.append(self.node_index[v])
+            self.cost_matrix[self.node_index[u], self.node_index[v]] = cost
+        self.edge_sources = np.array(edge_sources, dtype=np.intp)
+        self.edge_targets = np.array(edge_targets, dtype=np.intp)
+        # Cost heuristic matrices, one per edge cost bias (beta), built on first use
+        self.heuristic_matrices: Dict[float, np.ndarray] = {}
+        self.neighbor_indices: List[np.ndarray] = [
+            np.array([self.node_index[v] for v in self.graph.neighbors(u)], dtype=np.intp)
+            for u in self.nodes
+        ]
+
     def set_edge_pheromones(self, u: str, v: str, pheromone_value: float) -> None:
-        self.graph[u][v]["pheromones"] = pheromone_value
+        self.pheromone_matrix[self.node_index[u], self.node_index[v]] = pheromone_value
+
+    def set_all_edges_pheromones(self, pheromone_value: float) -> None:
+        self.pheromone_matrix[self.edge_sources, self.edge_targets] = pheromone_value
 
     def get_edge_pheromones(self, u: str, v: str) -> float:
-        return self.graph[u][v]["pheromones"]
+        return float(self.pheromone_matrix[self.node_index[u], self.node_index[v]])
 
     def deposit_pheromones(self, u: str, v: str, pheromone_amount: float) -> None:
-        self.graph[u][v]["pheromones"] += max(
+        self.pheromone_matrix[self.node_index[u], self.node_index[v]] += max(
+            (1 - self.evaporation_rate) + pheromone_amount, 1e-13
+        )
+
+    def deposit_pheromones_on_path(self, path: List[str], pheromone_amount: float) -> None:
+        # An ant never revisits a node, so the path edges are unique and a single
+        # fancy-indexed update is equivalent to depositing edge by edge
+        path_indices = [self.node_index[node] for node in path]
+        self.pheromone_matrix[path_indices[:-1], path_indices[1:]] += max(
             (1 - self.evaporation_rate) + pheromone_amount, 1e-13
         )
 
     def get_edge_cost(self, u: str, v: str) -> float:
-        return self.graph[u][v]["cost"]
+        return self.get_edge_cost_by_index(self.node_index[u], self.node_index[v])
 
-    def get_all_nodes(self) -> List[str]:
-        return list(self.graph.nodes)
+    def get_edge_cost_by_index(self, u: int, v: int) -> float:
+        return float(self.cost_matrix[u, v])
+
+    def get_edges_pheromones(self, u: int, neighbors: np.ndarray) -> np.ndarray:
+        return self.pheromone_matrix[u, neighbors]
+
+    def get_edges_heuristic(self, u: int, neighbors: np.ndarray, beta: float) -> np.ndarray:
+        heuristic_matrix = self.heuristic_matrices.get(beta)
+        if heuristic_matrix is None:
+            # Edge costs never change during the search, so (1 / cost) ^ beta is computed once
+            heuristic_matrix = utils.compute_edge_heuristic(self.cost_matrix, beta)
+            self.heuristic_matrices[beta] = heuristic_matrix
+        return heuristic_matrix[u, neighbors]
+
+    def get_all_nodes(self) -> Tuple[str, ...]:
+        return self.nodes
 
     def get_neighbors(self, node: str) -> List[str]:
         return list(self.graph.neighbors(node))
 
+    def get_neighbor_indices(self, u: int) -> np.ndarray:
+        return self.neighbor_indices[u]
+
     def visualize_graph(self, shortest_path: List[str]) -> None:
+        # matplotlib is only needed for plotting, keep its import cost out of plain runs
+        import matplotlib.pyplot as plt
+
         for edge in self.graph.edges:
             source, destination = edge[0], edge[1]
             self.graph[source][destination]["pheromones"] = round(
-                self.graph[source][destination]["pheromones"]
+                self.get_edge_pheromones(source, destination)
             )
 
         pos = nx.spring_layout(self.graph, seed=2)
@@ -1,31 +1,32 @@
 import random
-from typing import Dict
 
+import numpy as np
 
 
-def compute_edge_desirability(
-    pheromone_value: float, edge_cost: float, alpha: float, beta: float
-) -> float:
-    return pow(pheromone_value, alpha) * pow((1 / edge_cost), beta)
-
-
-def roulette_wheel_selection(probabilities: Dict[str, float]) -> str:
-    """source: https://en.wikipedia.org/wiki/Fitness_proportionate_selection"""
-    sorted_probabilities = {
-        k: v for k, v in sorted(probabilities.items(), key=lambda item: -item[1])
-    }
 
-    """ probabilities = {"A": 0.3, "B": 0.5, "C": 0.2}
-        ordered       = {"B": 0.5, "A": 0.3, "C": 0.2}
-    """
+def compute_edge_heuristic(edge_cost: np.ndarray, beta: float) -> np.ndarray:
+    return pow((1 / edge_cost), beta)
 
 
-    pick = random.random()
-    current = 0.0
-    for node, fitness in sorted_probabilities.items():
-        current += fitness
-        if current > pick:
-            return node
-    raise Exception("Edge case for roulette wheel selection")
+def compute_edge_desirability(
+    pheromone_value: np.ndarray, edge_heuristic: np.ndarray, alpha: float
+) -> np.ndarray:
+    return pow(pheromone_value, alpha) * edge_heuristic
 
 
+def roulette_wheel_selection(
+    nodes: np.ndarray, probabilities: np.ndarray, rng: random.Random
+) -> int:
+    """source: https://en.wikipedia.org/wiki/Fitness_proportionate_selection"""
+    # The wheel does not need the slices ordered: each node is still picked with its own
+    # probability. The first slice whose cumulative end passes the pick is found by a
+    # binary search over the running sum instead of a Python loop
+    # A NaN probability makes every later running sum NaN, and searchsorted treats NaN as
+    # larger than any pick, so it would silently land on the first NaN slice. The total of
+    # a valid wheel is finite, anything else is the same edge case as an overshoot
+    cumulative = np.cumsum(probabilities)
+    pick = rng.random()
+    selected = int(np.searchsorted(cumulative, pick, side="right"))
+    if not np.isfinite(cumulative[-1]) or selected == len(probabilities):
+        raise Exception("Edge case for roulette wheel selection")
+    return int(nodes[selected])